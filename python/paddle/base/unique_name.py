@@ -48,8 +48,8 @@ class UniqueNameGenerator:
         Returns(str): A unique string with the prefix
         """
         tmp = self.ids[key]
-        self.ids[key] += 1
-        return self.prefix + "_".join([key, str(tmp)])
+        self.ids[key] = tmp + 1
+        return f"{self.prefix}{key}_{tmp}"
 
     def generate_with_ignorable_key(self, key):
         from .framework import _dygraph_tracer, in_dygraph_mode
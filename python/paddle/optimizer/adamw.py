@@ -231,6 +231,9 @@ class AdamW(Optimizer):
             self._parameter_list = list(parameters)
         else:
             self._parameter_list = None
+        has_param_groups = bool(self._parameter_list) and isinstance(
+            self._parameter_list[0], dict
+        )
 
         self._name = name
         if framework.in_dygraph_mode():
@@ -252,7 +255,7 @@ class AdamW(Optimizer):
         self._dtype = None
         # Infer the dtype form parameter
         if self._parameter_list:
-            if isinstance(self._parameter_list[0], dict):
+            if has_param_groups:
                 for param_group in self._parameter_list:
                     assert (
                         'params' in param_group
@@ -264,11 +267,17 @@ class AdamW(Optimizer):
         # each program should have a independent learning rate
         # program -> tensor(learning_rate)
         self._learning_rate_map = {}
+        # global learning rate resolved once per optimization pass
+        self._cached_global_lr = None
+        # (param lr, device) -> scaled learning rate of the current pass
+        self._scaled_lr_cache = {}
+        # (startup program, {parameter name: value}) of the current pass
+        self._startup_param_index = None
         # Dictionary of accumulators. Some optimizer subclasses need to
         # allocate and manage extra tensors associated with the parameters
         # to train. These tensors are called accumulators.
         # {accum_name : { parameter_name : accumulator_for_parameter, ...}, ...}
-        self._accumulators = defaultdict(lambda: {})
+        self._accumulators = defaultdict(dict)
         self.helper = None
         self._opti_name_list = []
         self._accumulators_holder = {}
@@ -301,7 +310,7 @@ class AdamW(Optimizer):
         }
 
         self._param_groups = []
-        if self._parameter_list and isinstance(self._parameter_list[0], dict):
+        if has_param_groups:
             for param_group in self._parameter_list:
                 self._add_param_group(param_group.copy())
         else:
@@ -346,11 +355,13 @@ class AdamW(Optimizer):
         for k, v in self._default_dict.items():
             param_group.setdefault(k, v)
 
+        # one set of the existing parameters per call, the new group is
+        # checked against it without being copied into a set as well
         param_set = set()
         for group in self._param_groups:
-            param_set.update(set(group['params']))
+            param_set.update(group['params'])
 
-        if not param_set.isdisjoint(set(param_group['params'])):
+        if not param_set.isdisjoint(param_group['params']):
             raise ValueError(
                 "some parameters appear in more than one parameter group"
             )
@@ -676,7 +687,7 @@ class AdamW(Optimizer):
         else:
             # optimize parameters in groups
             for param_group in self._param_groups:
-                params_grads = defaultdict(lambda: [])
+                params_grads = defaultdict(list)
                 for param in param_group['params']:
                     if param.stop_gradient:
                         continue
@@ -18,13 +18,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import logging
 import os
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 import paddle
 import paddle.autograd as imperative_base
 from paddle import _C_ops
@@ -75,6 +75,16 @@ g_shard_bypass_dygraph_optimizer = int(
     os.environ.get("FLAGS_shard_bypass_dygraph_optimizer", 0)
 )
 
+# fp16 and bf16 dtypes of both the legacy static graph and pir
+_FP16_OR_BF16_DTYPES = frozenset(
+    {
+        core.VarDesc.VarType.FP16,
+        core.VarDesc.VarType.BF16,
+        core.DataType.FLOAT16,
+        core.DataType.BFLOAT16,
+    }
+)
+
 
 @framework.static_only
 def append_backward_new(
@@ -92,10 +102,9 @@ def append_backward_new(
         program.num_blocks == 1
     ), "The append_backward_new interface is designed to process only one block."
     block = program.current_block()
-    for el in loss_list:
-        assert (
-            el.block == block
-        ), 'variable in loss_list should be in current block of main program'
+    assert all(
+        el.block == block for el in loss_list
+    ), 'variable in loss_list should be in current block of main program'
 
     orig2prim(block)
     ad = Transform(block)
@@ -105,25 +114,29 @@ def append_backward_new(
     loss_bar, param_bar = ad.transpose(loss_dot, param_dot)
 
     # remove param_dot and their constructor ops
-    op_indexes = []
-    for var in param_dot:
-        if var is not None:
-            op_index = block.ops.index(var.op)
-            assert op_index >= 0
-            op_indexes.append(op_index)
+    op_pos = {id(op): i for i, op in enumerate(block.ops)}
+    op_indexes = sorted(
+        op_pos[id(var.op)] for var in param_dot if var is not None
+    )
 
-    ad.erase_ops(sorted(op_indexes))
+    ad.erase_ops(op_indexes)
     ad.erase_dots(param_dot)
 
     if len(parameter_list) == 1:
         params_and_grads = [(parameter_list, param_bar)]
     else:
-        params_and_grads = []
-        for i, param in enumerate(parameter_list):
-            params_and_grads.append((param, param_bar[i]))
+        params_and_grads = list(zip(parameter_list, param_bar))
     return params_and_grads
 
 
+def _device_guard_if_needed(device):
+    # device_guard only switches the device recorded on new ops, so entering
+    # it is a no-op when the requested device is already the current one
+    if device == framework._current_device:
+        return contextlib.nullcontext()
+    return device_guard(device)
+
+
 class Optimizer:
     r"""Optimizer Base class.
 
@@ -231,6 +244,9 @@ class Optimizer:
             self._parameter_list = list(parameters)
         else:
             self._parameter_list = None
+        has_param_groups = bool(self._parameter_list) and isinstance(
+            self._parameter_list[0], dict
+        )
 
         self._name = name
         if framework.in_dygraph_mode():
@@ -238,18 +254,20 @@ class Optimizer:
                 raise AttributeError(
                     "parameters argument given to the Optimizer should not be None in dygraph mode."
                 )
-            if weight_decay is not None:
-                if not isinstance(self._parameter_list[0], dict):
-                    for param in self._parameter_list:
-                        if (
-                            hasattr(param, 'regularizer')
-                            and param.regularizer is not None
-                        ):
-                            logging.info(
-                                "If regularizer of a Parameter has been set by 'paddle.ParamAttr' or 'static.WeightNormParamAttr' already. "
-                                f"The weight_decay[{weight_decay}] in Optimizer will not take effect, and it will only be applied to other Parameters!"
-                            )
-                            break
+            # the scan only serves the log below, skip it when INFO is off
+            if (
+                weight_decay is not None
+                and not has_param_groups
+                and logging.getLogger().isEnabledFor(logging.INFO)
+                and any(
+                    getattr(param, 'regularizer', None) is not None
+                    for param in self._parameter_list
+                )
+            ):
+                logging.info(
+                    "If regularizer of a Parameter has been set by 'paddle.ParamAttr' or 'static.WeightNormParamAttr' already. "
+                    f"The weight_decay[{weight_decay}] in Optimizer will not take effect, and it will only be applied to other Parameters!"
+                )
 
         if not isinstance(learning_rate, (float, LRScheduler)):
             raise TypeError(
@@ -272,7 +290,7 @@ class Optimizer:
         self._dtype = None
         # Infer the dtype form parameter
         if self._parameter_list:
-            if isinstance(self._parameter_list[0], dict):
+            if has_param_groups:
                 for param_group in self._parameter_list:
                     assert (
                         'params' in param_group
@@ -284,11 +302,17 @@ class Optimizer:
         # each program should have a independent learning rate
         # program -> tensor(learning_rate)
         self._learning_rate_map = {}
+        # global learning rate resolved once per optimization pass
+        self._cached_global_lr = None
+        # (param lr, device) -> scaled learning rate of the current pass
+        self._scaled_lr_cache = {}
+        # (startup program, {parameter name: value}) of the current pass
+        self._startup_param_index = None
         # Dictionary of accumulators. Some optimizer subclasses need to
         # allocate and manage extra tensors associated with the parameters
         # to train. These tensors are called accumulators.
         # {accum_name : { paramter_name : accumulator_for_parameter, ...}, ...}
-        self._accumulators = defaultdict(lambda: {})
+        self._accumulators = defaultdict(dict)
         self.helper = None
         self._opti_name_list = []
         self._accumulators_holder = {}
@@ -300,7 +324,7 @@ class Optimizer:
         }
 
         self._param_groups = []
-        if self._parameter_list and isinstance(self._parameter_list[0], dict):
+        if has_param_groups:
             for param_group in self._parameter_list:
                 self._add_param_group(param_group.copy())
         else:
@@ -330,10 +354,11 @@ class Optimizer:
         self._auxiliary_vars[key] = val
 
     def _create_multi_tensor_dict(self):
-        n = len(self._param_groups) if self._param_groups is not None else 1
+        # the list of each param group is created on its first access, so no
+        # list is allocated for optimizers that never use multi tensor
         return {
-            'FP32_LODTensor': [[] for _ in range(n)],
-            'FP16_LODTensor': [[] for _ in range(n)],
+            'FP32_LODTensor': defaultdict(list),
+            'FP16_LODTensor': defaultdict(list),
         }
 
     def _get_auxiliary_var(self, key):
@@ -361,21 +386,27 @@ class Optimizer:
         '''
         state_dict = {}
         if len(self._accumulators) == 0 and len(self._accumulators_holder) > 0:
-            for name, var in self._accumulators_holder.items():
-                state_dict[name] = var
+            state_dict.update(self._accumulators_holder)
         else:
-            for k, v in self._accumulators.items():
-                for para_name, var_tmp in v.items():
-                    state_dict[var_tmp.name] = var_tmp
-                    # save scale value for xpu
-                    if core.is_compiled_with_xpu():
-                        xpu_adamw_moment_dtype = os.getenv(
-                            "xpu_adamw_moment_dtype", default="fp32"
-                        )
-                        if xpu_adamw_moment_dtype == "fp16":
-                            state_dict[var_tmp.name + ".SCALE_VALUE"] = (
-                                var_tmp.get_tensor().get_xpu_scale_value()
-                            )
+            state_dict = {
+                var_tmp.name: var_tmp
+                for v in self._accumulators.values()
+                for var_tmp in v.values()
+            }
+            # save scale value for xpu
+            if (
+                core.is_compiled_with_xpu()
+                and os.getenv("xpu_adamw_moment_dtype", default="fp32")
+                == "fp16"
+            ):
+                state_dict.update(
+                    {
+                        var_tmp.name
+                        + ".SCALE_VALUE": var_tmp.get_tensor().get_xpu_scale_value()
+                        for v in self._accumulators.values()
+                        for var_tmp in v.values()
+                    }
+                )
         # if has master weight and then save master weight
         if hasattr(self, "_master_weights"):
             if len(self._master_weights) != 0:
@@ -431,23 +462,22 @@ class Optimizer:
                 self._master_weights = state_dict["master_weights"]
             state_dict.pop("master_weights")
         self._accumulators_holder = state_dict
-        for k, v in self._accumulators.items():
-            for para_name, var_tmp in v.items():
+        # load scale value for xpu
+        load_xpu_scale_value = (
+            core.is_compiled_with_xpu()
+            and os.getenv("xpu_adamw_moment_dtype", default="fp32") == "fp16"
+        )
+        for v in self._accumulators.values():
+            for var_tmp in v.values():
                 assert (
                     var_tmp.name in state_dict
                 ), f"optimizer Tensor {var_tmp.name} not found"
 
                 var = var_tmp.value()
-                tensor = var.get_tensor()
-                # load scale value for xpu
-                if core.is_compiled_with_xpu():
-                    xpu_adamw_moment_dtype = os.getenv(
-                        "xpu_adamw_moment_dtype", default="fp32"
+                if load_xpu_scale_value:
+                    var.get_tensor().set_xpu_scale_value(
+                        state_dict.get(var_tmp.name + ".SCALE_VALUE", -1.0)
                     )
-                    if xpu_adamw_moment_dtype == "fp16":
-                        tensor.set_xpu_scale_value(
-                            state_dict.get(var_tmp.name + ".SCALE_VALUE", -1.0)
-                        )
                 var.set_value(state_dict[var_tmp.name])
 
     def get_opti_var_name_list(self) -> list[str]:
@@ -455,32 +485,35 @@ class Optimizer:
 
     def _create_global_learning_rate(self):
         def do_create():
-            # lr var can't be float16 or bfloat16, for pure fp16 or bf16 training, should extra handle the dtype for lr
-            _lr_dtype = (
-                paddle.get_default_dtype()
-                if self._dtype is None
-                else self._dtype
+            # resolve the mode and current program once, they don't change
+            # during the creation of the global learning rate
+            pir = in_pir_mode()
+            main_program = (
+                paddle.static.default_main_program()
+                if pir
+                else framework.default_main_program()
             )
+            lr_map = self._learning_rate_map
+            default_dtype = paddle.get_default_dtype()
+
+            # lr var can't be float16 or bfloat16, for pure fp16 or bf16 training, should extra handle the dtype for lr
+            _lr_dtype = default_dtype if self._dtype is None else self._dtype
             _lr_dtype = (
                 paddle.float32
                 if (
-                    (
-                        paddle.get_default_dtype() != "float16"
-                        and _lr_dtype == paddle.float16
-                    )
+                    (default_dtype != "float16" and _lr_dtype == paddle.float16)
                     or (
-                        paddle.get_default_dtype() != "bfloat16"
+                        default_dtype != "bfloat16"
                         and _lr_dtype == paddle.bfloat16
                     )
                 )
                 else _lr_dtype
             )
             if isinstance(self._learning_rate, LRScheduler):
-                lr_var = self._global_learning_rate()
+                lr_var = lr_map.get(main_program, None)
                 # only create global lr_var once
-                if in_pir_mode():
+                if pir:
                     startup_program = paddle.static.default_startup_program()
-                    main_program = paddle.static.default_main_program()
 
                     lr_name = unique_name.generate('learning_rate')
                     # startup program  insert && set_parameter
@@ -508,7 +541,7 @@ class Optimizer:
                         main_program.lr_scheduler = self._learning_rate
                         main_program.lr_var = param
                         main_program.lr_name = lr_name
-                        self._learning_rate_map[main_program] = param
+                        lr_map[main_program] = param
 
                 else:
                     if not isinstance(lr_var, framework.Variable):
@@ -521,13 +554,9 @@ class Optimizer:
                             stop_gradient=True,
                             dtype=_lr_dtype,
                         )
-                        main_prog = framework.default_main_program()
-                        main_prog.lr_scheduler = self._learning_rate
-                        main_prog.lr_var = lr_var
-
-                        self._learning_rate_map[
-                            framework.default_main_program()
-                        ] = lr_var
+                        main_program.lr_scheduler = self._learning_rate
+                        main_program.lr_var = lr_var
+                        lr_map[main_program] = lr_var
 
                     lr_value = float(self._learning_rate())
                     self.helper.set_variable_initializer(
@@ -538,12 +567,11 @@ class Optimizer:
                     )
             elif isinstance(self._learning_rate, float):
                 # only create global lr_var once
-                lr = self._global_learning_rate()
-                if in_pir_mode():
+                lr = lr_map.get(main_program, None)
+                if pir:
                     if isinstance(lr, paddle.pir.Value):
                         return
                     else:
-                        place = _current_expected_place()
                         if not isinstance(_lr_dtype, paddle.base.core.DataType):
                             if isinstance(
                                 _lr_dtype, paddle.base.libpaddle.VarDesc.VarType
@@ -557,23 +585,21 @@ class Optimizer:
                                         _lr_dtype
                                     )
                                 )
-                        self._learning_rate_map[
-                            paddle.static.default_main_program()
-                        ] = paddle.pir.core.create_persistable_value(
-                            dtype=_lr_dtype,
-                            shape=[],
-                            name=unique_name.generate("learning_rate"),
-                            initializer=paddle.nn.initializer.ConstantInitializer(
-                                value=float(self._learning_rate)
-                            ),
+                        lr_map[main_program] = (
+                            paddle.pir.core.create_persistable_value(
+                                dtype=_lr_dtype,
+                                shape=[],
+                                name=unique_name.generate("learning_rate"),
+                                initializer=paddle.nn.initializer.ConstantInitializer(
+                                    value=float(self._learning_rate)
+                                ),
+                            )
                         )
                 else:
                     if isinstance(lr, framework.Variable):
                         return
                     else:
-                        self._learning_rate_map[
-                            framework.default_main_program()
-                        ] = paddle.static.create_global_var(
+                        lr_map[main_program] = paddle.static.create_global_var(
                             name=unique_name.generate("learning_rate"),
                             shape=[],
                             value=float(self._learning_rate),
@@ -819,16 +845,46 @@ class Optimizer:
                 return param_lr
             else:
                 if param_lr == 1.0:
-                    return self._global_learning_rate()
-                else:
-                    with paddle.static.default_main_program()._lr_schedule_guard(
-                        is_with_opt=True
-                    ), framework.name_scope(
-                        'scale_with_param_lr'
-                    ):
-                        return self._global_learning_rate() * param_lr
+                    return self._get_pass_global_learning_rate()
+                # inside an optimization pass, parameters on the same device
+                # sharing a learning rate scale share one scaled lr as well
+                in_pass = self._cached_global_lr is not None
+                if in_pass:
+                    key = (param_lr, self._get_device_for_param(param.name))
+                    scaled_lr = self._scaled_lr_cache.get(key)
+                    if scaled_lr is not None:
+                        return scaled_lr
+                with paddle.static.default_main_program()._lr_schedule_guard(
+                    is_with_opt=True
+                ), framework.name_scope('scale_with_param_lr'):
+                    scaled_lr = self._get_pass_global_learning_rate() * param_lr
+                if in_pass:
+                    self._scaled_lr_cache[key] = scaled_lr
+                return scaled_lr
         else:
-            return self._global_learning_rate()
+            return self._get_pass_global_learning_rate()
+
+    @contextlib.contextmanager
+    def _pass_lr_cache_guard(self):
+        # cache the global and scaled learning rates and the startup parameter
+        # index for the duration of one optimization pass, and always drop
+        # them afterwards, also when the pass raises
+        self._cached_global_lr = self._global_learning_rate()
+        self._scaled_lr_cache = {}
+        self._startup_param_index = None
+        try:
+            yield
+        finally:
+            self._cached_global_lr = None
+            self._scaled_lr_cache = {}
+            self._startup_param_index = None
+
+    def _get_pass_global_learning_rate(self):
+        # inside an optimization pass the global learning rate is resolved
+        # once, outside of it fall back to looking it up for every call
+        if self._cached_global_lr is not None:
+            return self._cached_global_lr
+        return self._global_learning_rate()
 
     def _create_master_weight(self, param):
         if param.name in self._master_weights:
@@ -839,17 +895,7 @@ class Optimizer:
                 startup_program = paddle.static.default_startup_program()
                 main_program = paddle.static.default_main_program()
                 with paddle.static.program_guard(startup_program):
-
-                    def get_param_from_startup(startup, name):
-                        for op in startup.global_block().ops:
-                            if (
-                                op.name() == 'builtin.set_parameter'
-                                and name == op.attrs()['parameter_name']
-                            ):
-                                return op.operand(0).source()
-                        return None
-
-                    startup_param = get_param_from_startup(
+                    startup_param = self._get_param_from_startup(
                         startup_program, param.name
                     )
                     startup_var = paddle.cast(startup_param, 'float32')
@@ -899,6 +945,28 @@ class Optimizer:
             self._master_weights[param.name] = var
         return var
 
+    def _get_param_from_startup(self, startup_program, name):
+        # index the set_parameter ops of the startup program instead of
+        # scanning all of its ops for every parameter. The index is only kept
+        # within one optimization pass, and rebuilt when the startup program
+        # changes or new parameters are added
+        cached = self._startup_param_index
+        if (
+            cached is None
+            or cached[0] is not startup_program
+            or name not in cached[1]
+        ):
+            param_index = {}
+            for op in startup_program.global_block().ops:
+                if op.name() == 'builtin.set_parameter':
+                    param_index.setdefault(
+                        op.attrs()['parameter_name'], op.operand(0).source()
+                    )
+            cached = (startup_program, param_index)
+            if self._cached_global_lr is not None:
+                self._startup_param_index = cached
+        return cached[1].get(name, None)
+
     def _gen_master_weight_var_name(self, param):
         var_name = param.name + "_fp32_master"
         return unique_name.generate(var_name)
@@ -906,16 +974,14 @@ class Optimizer:
     def _create_master_grad(self, grad):
         assert self._is_dtype_fp16_or_bf16(grad.dtype)
         if in_pir_mode():
-            if grad in self._master_grads:
-                var = self._master_grads[grad]
-            else:
+            var = self._master_grads.get(grad)
+            if var is None:
                 var = paddle.cast(grad, 'float32')
                 var.get_defining_op().set_bool_attr('master_grad_cast', True)
                 self._master_grads[grad] = var
         else:
-            if grad.name in self._master_grads:
-                var = self._master_grads[grad.name]
-            else:
+            var = self._master_grads.get(grad.name)
+            if var is None:
                 var_name = grad.name + "_fp32_master"
                 var_name = unique_name.generate(var_name)
                 var = grad.block.create_var(
@@ -973,12 +1039,10 @@ class Optimizer:
         """
         if self._name is not None:
             name = self._name + "_" + name
-        if (
-            name in self._accumulators
-            and param.name in self._accumulators[name]
-        ):
+        var = self._accumulators.get(name, {}).get(param.name)
+        if var is not None:
             if framework.in_dygraph_mode():
-                return self._accumulators[name][param.name]
+                return var
             raise Exception(
                 f"Accumulator {name} already exists for parameter {param.name}"
             )
@@ -1036,7 +1100,7 @@ class Optimizer:
                     core.CPUPlace(),
                 )
             else:
-                with device_guard(device):
+                with _device_guard_if_needed(device):
                     self.helper.set_variable_initializer(
                         var,
                         initializer=paddle.nn.initializer.Constant(
@@ -1078,14 +1142,12 @@ class Optimizer:
         """
         if self._name is not None:
             name = self._name + "_" + name
-        if (
-            name not in self._accumulators
-            or param.name not in self._accumulators[name]
-        ):
+        var = self._accumulators.get(name, {}).get(param.name)
+        if var is None:
             raise Exception(
                 f"Accumulator {name} does not exist for parameter {param.name}"
             )
-        return self._accumulators[name][param.name]
+        return var
 
     def _get_accumulator_master(self, name, param):
         """Utility function to fetch an accumulator for a parameter
@@ -1104,30 +1166,33 @@ class Optimizer:
             self._master_weights[param.name] if find_master else param
         )
         target_name = target_param.name
-        if (
-            name not in self._accumulators
-            or target_name not in self._accumulators[name]
-        ):
+        var = self._accumulators.get(name, {}).get(target_name)
+        if var is None:
             raise Exception(
                 f"Accumulator {name} does not exist for parameter {target_name}"
             )
-        return self._accumulators[name][target_name]
+        return var
 
     def _update_param_device_map(self, parameters_and_grads, target_block):
-        for param_and_grad in parameters_and_grads:
-            if param_and_grad[0].stop_gradient is False:
-                param_name = param_and_grad[0].name
-                ops = target_block.ops
-                device_attr_name = (
-                    core.op_proto_and_checker_maker.kOpDeviceAttrName()
-                )
-                for op in ops:
-                    input_arg_names = op.input_arg_names
-                    if param_name in input_arg_names:
-                        self._param_device_map[param_name] = op.attr(
-                            device_attr_name
-                        )
-                        break
+        # the device of a parameter is the one of the first op reading it, so
+        # walk the ops once and resolve every pending parameter on the way
+        pending = {
+            param_and_grad[0].name
+            for param_and_grad in parameters_and_grads
+            if param_and_grad[0].stop_gradient is False
+        }
+        if not pending:
+            return
+        device_attr_name = core.op_proto_and_checker_maker.kOpDeviceAttrName()
+        for op in target_block.ops:
+            found = pending.intersection(op.input_arg_names)
+            if found:
+                device = op.attr(device_attr_name)
+                for param_name in found:
+                    self._param_device_map[param_name] = device
+                pending -= found
+                if not pending:
+                    break
 
     def _get_device_for_param(self, param_name):
         device = None
@@ -1161,176 +1226,183 @@ class Optimizer:
         # But if current block is in control flow, append optimize op in the
         # grad block of current block
 
-        global_block = framework.default_main_program().global_block()
+        main_program = framework.default_main_program()
+        global_block = main_program.global_block()
         target_block = global_block
-        current_block = framework.default_main_program().current_block()
+        current_block = main_program.current_block()
         if current_block.idx != global_block.idx:
             assert (
                 current_block.backward_block_idx != -1
             ), "current block is not global_block, but it doesn't have backward block."
-            target_block = framework.default_main_program().blocks[
-                current_block.backward_block_idx
-            ]
+            target_block = main_program.blocks[current_block.backward_block_idx]
 
         start = len(target_block.ops)
         self.helper = LayerHelper(self.__class__.__name__)
 
         self._create_global_learning_rate()
-
-        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode
-        if self._use_multi_tensor and self.__class__.__name__ in [
-            'Momentum',
-            'Adam',
-        ]:
-            if (
-                len(self._param_dict['FP32_LODTensor'][param_group_idx]) == 0
-                and len(self._param_dict['FP16_LODTensor'][param_group_idx])
-                == 0
-            ):
-                if isinstance(parameters_and_grads, list):
-                    assert param_group_idx == 0
-                    self._multi_tensor_init(
-                        target_block,
-                        [
-                            p[0]
-                            for p in parameters_and_grads
-                            if not p[0].stop_gradient
-                        ],
-                        param_group_idx,
-                    )
-                else:
-                    self._update_param_group(parameters_and_grads)
-                    self._multi_tensor_init(
-                        target_block,
-                        [
-                            p[0]
-                            for p in parameters_and_grads['params']
-                            if not p[0].stop_gradient
-                        ],
-                        param_group_idx,
-                    )
-            if framework.in_dygraph_mode():
-                self._append_optimize_multi_tensor_op(
-                    target_block,
-                    parameters_and_grads,
-                    param_group_idx=param_group_idx,
-                )
-            else:
-                self._update_param_device_map(
-                    parameters_and_grads, target_block
-                )
-                # NOTE: Multi Tensor requires all parameters to be in the same device and program.
-                # param_grad_list = [p_0,g_0,p_1,g_1,....]
-                param_grad_list = []
-                for param_and_grad in parameters_and_grads:
-                    if (
-                        not param_and_grad[0].stop_gradient
-                        and param_and_grad[1] is not None
-                    ):
-                        param_grad_list.append(param_and_grad[0])
-                        param_grad_list.append(param_and_grad[1])
-                with param_grad_list[0].block.program._optimized_guard(
-                    param_grad_list
-                ), name_scope("optimizer"):
-                    device = self._get_device_for_param(param_grad_list[0].name)
-                    with device_guard(device):
-                        self._append_optimize_multi_tensor_op(
-                            target_block,
-                            parameters_and_grads,
-                            param_group_idx=param_group_idx,
-                        )
-        else:
-            if not framework.in_dygraph_mode():
-                params_grads_device_map = (
+        with self._pass_lr_cache_guard():
+            # parameters that get accumulators, computed once for the pass
+            active_params = [
+                p[0]
+                for p in (
                     parameters_and_grads['params']
                     if isinstance(parameters_and_grads, dict)
                     else parameters_and_grads
                 )
-                self._update_param_device_map(
-                    params_grads_device_map, target_block
-                )
+                if not p[0].stop_gradient
+            ]
 
-            if isinstance(parameters_and_grads, list):
-                with paddle.base.framework.dygraph_guard_if_declarative():
-                    self._create_accumulators(
+            # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode
+            if self._use_multi_tensor and self.__class__.__name__ in [
+                'Momentum',
+                'Adam',
+            ]:
+                if (
+                    len(self._param_dict['FP32_LODTensor'][param_group_idx])
+                    == 0
+                    and len(self._param_dict['FP16_LODTensor'][param_group_idx])
+                    == 0
+                ):
+                    if isinstance(parameters_and_grads, list):
+                        assert param_group_idx == 0
+                        self._multi_tensor_init(
+                            target_block,
+                            active_params,
+                            param_group_idx,
+                        )
+                    else:
+                        self._update_param_group(parameters_and_grads)
+                        self._multi_tensor_init(
+                            target_block,
+                            active_params,
+                            param_group_idx,
+                        )
+                if framework.in_dygraph_mode():
+                    self._append_optimize_multi_tensor_op(
                         target_block,
-                        [
-                            p[0]
-                            for p in parameters_and_grads
-                            if not p[0].stop_gradient
-                        ],
+                        parameters_and_grads,
+                        param_group_idx=param_group_idx,
                     )
-            else:
-                params_acc_dict = parameters_and_grads.copy()
-                params_acc_dict['params'] = [
-                    p[0]
-                    for p in params_acc_dict['params']
-                    if not p[0].stop_gradient
-                ]
-                with paddle.base.framework.dygraph_guard_if_declarative():
-                    self._create_accumulators(target_block, params_acc_dict)
-
-            if framework.in_dygraph_mode():
-                found_inf = self._get_auxiliary_var('found_inf')
-                if found_inf:
-                    if isinstance(found_inf, core.eager.Tensor):
-                        self._set_auxiliary_var('found_inf', True)
                 else:
-                    if isinstance(found_inf, core.eager.Tensor):
-                        self._set_auxiliary_var('found_inf', False)
-                    if isinstance(parameters_and_grads, list):
-                        for param_and_grad in parameters_and_grads:
-                            # Parameters can be uninitialized in pipeline parallel of semi-auto parallel.
-                            # Since gradient clip and parameters update mixed up in one interface, so we
-                            # need to filter again here.
-                            if (
-                                param_and_grad[1] is None
-                                or not param_and_grad[0]._is_initialized()
-                            ):
-                                continue
-                            if param_and_grad[0].stop_gradient is False:
-                                self._append_optimize_op(
-                                    target_block, param_and_grad
-                                )
-                    else:
-                        for param_and_grad in parameters_and_grads['params']:
-                            if (
-                                param_and_grad[1] is None
-                                or not param_and_grad[0]._is_initialized()
-                            ):
-                                continue
-                            if param_and_grad[0].stop_gradient is False:
-                                param_grad_dict = {}
-                                param_grad_dict['params'] = param_and_grad
-                                param_grad_dict.update(
-                                    {
-                                        k: v
-                                        for k, v in parameters_and_grads.items()
-                                        if k != 'params'
-                                    }
-                                )
-                                self._append_optimize_op(
-                                    target_block, param_grad_dict
-                                )
-            else:
-                for param_and_grad in parameters_and_grads:
-                    if param_and_grad[1] is None:
-                        continue
-                    with param_and_grad[0].block.program._optimized_guard(
-                        param_and_grad
-                    ), name_scope("optimizer"):
-                        if param_and_grad[0].stop_gradient is False:
+                    self._update_param_device_map(
+                        parameters_and_grads, target_block
+                    )
+                    # NOTE: Multi Tensor requires all parameters to be in the same device and program.
+                    # param_grad_list = [p_0,g_0,p_1,g_1,....]
+                    param_grad_list = []
+                    for param_and_grad in parameters_and_grads:
+                        if (
+                            not param_and_grad[0].stop_gradient
+                            and param_and_grad[1] is not None
+                        ):
+                            param_grad_list.append(param_and_grad[0])
+                            param_grad_list.append(param_and_grad[1])
+                    # nothing to update, e.g. all parameters are frozen
+                    if param_grad_list:
+                        with param_grad_list[0].block.program._optimized_guard(
+                            param_grad_list
+                        ), name_scope("optimizer"):
                             device = self._get_device_for_param(
-                                param_and_grad[0].name
+                                param_grad_list[0].name
                             )
-                            with device_guard(device):
-                                optimize_op = self._append_optimize_op(
-                                    target_block, param_and_grad
+                            with _device_guard_if_needed(device):
+                                self._append_optimize_multi_tensor_op(
+                                    target_block,
+                                    parameters_and_grads,
+                                    param_group_idx=param_group_idx,
                                 )
+            else:
+                if not framework.in_dygraph_mode():
+                    params_grads_device_map = (
+                        parameters_and_grads['params']
+                        if isinstance(parameters_and_grads, dict)
+                        else parameters_and_grads
+                    )
+                    self._update_param_device_map(
+                        params_grads_device_map, target_block
+                    )
 
-        # Get custom finish ops for subclasses
-        # FIXME: Need to fix this once we figure out how to handle dependencies
-        self._finish_update(target_block, parameters_and_grads)
+                if isinstance(parameters_and_grads, list):
+                    with paddle.base.framework.dygraph_guard_if_declarative():
+                        self._create_accumulators(target_block, active_params)
+                else:
+                    params_acc_dict = parameters_and_grads.copy()
+                    params_acc_dict['params'] = active_params
+                    with paddle.base.framework.dygraph_guard_if_declarative():
+                        self._create_accumulators(target_block, params_acc_dict)
+
+                if framework.in_dygraph_mode():
+                    found_inf = self._get_auxiliary_var('found_inf')
+                    if found_inf:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', True)
+                    else:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', False)
+                        if isinstance(parameters_and_grads, list):
+                            for param_and_grad in parameters_and_grads:
+                                # Parameters can be uninitialized in pipeline parallel of semi-auto parallel.
+                                # Since gradient clip and parameters update mixed up in one interface, so we
+                                # need to filter again here.
+                                if (
+                                    param_and_grad[1] is None
+                                    or not param_and_grad[0]._is_initialized()
+                                ):
+                                    continue
+                                if param_and_grad[0].stop_gradient is False:
+                                    self._append_optimize_op(
+                                        target_block, param_and_grad
+                                    )
+                        else:
+                            for param_and_grad in parameters_and_grads[
+                                'params'
+                            ]:
+                                if (
+                                    param_and_grad[1] is None
+                                    or not param_and_grad[0]._is_initialized()
+                                ):
+                                    continue
+                                if param_and_grad[0].stop_gradient is False:
+                                    param_grad_dict = {}
+                                    param_grad_dict['params'] = param_and_grad
+                                    param_grad_dict.update(
+                                        {
+                                            k: v
+                                            for k, v in parameters_and_grads.items()
+                                            if k != 'params'
+                                        }
+                                    )
+                                    self._append_optimize_op(
+                                        target_block, param_grad_dict
+                                    )
+                else:
+                    params_grads = [
+                        param_and_grad
+                        for param_and_grad in parameters_and_grads
+                        if param_and_grad[1] is not None
+                        and param_and_grad[0].stop_gradient is False
+                    ]
+                    # enter name_scope once for the whole pass and device_guard
+                    # once per run of consecutive parameters on the same device,
+                    # the order of the optimize ops is kept unchanged
+                    with name_scope("optimizer"):
+                        for device, device_params_grads in itertools.groupby(
+                            params_grads,
+                            key=lambda p: self._get_device_for_param(p[0].name),
+                        ):
+                            with _device_guard_if_needed(device):
+                                for param_and_grad in device_params_grads:
+                                    program = param_and_grad[0].block.program
+                                    with program._optimized_guard(
+                                        param_and_grad
+                                    ):
+                                        self._append_optimize_op(
+                                            target_block, param_and_grad
+                                        )
+
+            # Get custom finish ops for subclasses
+            # FIXME: Need to fix this once we figure out how to handle dependencies
+            self._finish_update(target_block, parameters_and_grads)
         paddle.base.core._set_warmup(False)
 
         end = len(target_block.ops)
@@ -1358,53 +1430,57 @@ class Optimizer:
         last_op = target_block.ops[-1]
 
         self._create_global_learning_rate()
-
-        # params_grads_device_map = (
-        #     parameters_and_grads['params']
-        #     if isinstance(parameters_and_grads, dict)
-        #     else parameters_and_grads
-        # )
-        # self._update_param_device_map(params_grads_device_map, target_block)
-
-        if isinstance(parameters_and_grads, list):
-            self._create_accumulators(
-                target_block,
-                [p[0] for p in parameters_and_grads if not p[0].stop_gradient],
-            )
-        else:
-            params_acc_dict = parameters_and_grads.copy()
-            params_acc_dict['params'] = [
+        with self._pass_lr_cache_guard():
+            # parameters that get accumulators, computed once for the pass
+            active_params = [
                 p[0]
-                for p in params_acc_dict['params']
+                for p in (
+                    parameters_and_grads['params']
+                    if isinstance(parameters_and_grads, dict)
+                    else parameters_and_grads
+                )
                 if not p[0].stop_gradient
             ]
-            self._create_accumulators(target_block, params_acc_dict)
-
-        if isinstance(parameters_and_grads, list):
-            for param_and_grad in parameters_and_grads:
-                if param_and_grad[1] is None:
-                    continue
-                if param_and_grad[0].stop_gradient is False:
-                    self._append_optimize_op(target_block, param_and_grad)
-        else:
-            for param_and_grad in parameters_and_grads['params']:
-                if param_and_grad[1] is None:
-                    continue
-                if param_and_grad[0].stop_gradient is False:
-                    param_grad_dict = {}
-                    param_grad_dict['params'] = param_and_grad
-                    param_grad_dict.update(
-                        {
-                            k: v
-                            for k, v in parameters_and_grads.items()
-                            if k != 'params'
-                        }
-                    )
-                    self._append_optimize_op(target_block, param_grad_dict)
 
-        # Get custom finish ops for subclasses
-        # FIXME: Need to fix this once we figure out how to handle dependencies
-        self._finish_update(target_block, parameters_and_grads)
+            # params_grads_device_map = (
+            #     parameters_and_grads['params']
+            #     if isinstance(parameters_and_grads, dict)
+            #     else parameters_and_grads
+            # )
+            # self._update_param_device_map(params_grads_device_map, target_block)
+
+            if isinstance(parameters_and_grads, list):
+                self._create_accumulators(target_block, active_params)
+            else:
+                params_acc_dict = parameters_and_grads.copy()
+                params_acc_dict['params'] = active_params
+                self._create_accumulators(target_block, params_acc_dict)
+
+            if isinstance(parameters_and_grads, list):
+                for param_and_grad in parameters_and_grads:
+                    if param_and_grad[1] is None:
+                        continue
+                    if param_and_grad[0].stop_gradient is False:
+                        self._append_optimize_op(target_block, param_and_grad)
+            else:
+                for param_and_grad in parameters_and_grads['params']:
+                    if param_and_grad[1] is None:
+                        continue
+                    if param_and_grad[0].stop_gradient is False:
+                        param_grad_dict = {}
+                        param_grad_dict['params'] = param_and_grad
+                        param_grad_dict.update(
+                            {
+                                k: v
+                                for k, v in parameters_and_grads.items()
+                                if k != 'params'
+                            }
+                        )
+                        self._append_optimize_op(target_block, param_grad_dict)
+
+            # Get custom finish ops for subclasses
+            # FIXME: Need to fix this once we figure out how to handle dependencies
+            self._finish_update(target_block, parameters_and_grads)
         paddle.base.core._set_warmup(False)
 
         start_index = target_block.ops.index(last_op) + 1
@@ -1469,18 +1545,19 @@ class Optimizer:
 
             # It is very time-consuming to call c++ functions in a loop on the python side.
             # We put this part of the code on the c++ side to improve the speed in eager mode.
-            params_grads = []
             grads = core.eager.get_all_grads(parameter_list)
-            for index, grad in enumerate(grads):
-                if grad is not None:
-                    params_grads.append((parameter_list[index], grad))
+            params_grads = [
+                (param, grad)
+                for param, grad in zip(parameter_list, grads)
+                if grad is not None
+            ]
         else:
             if callbacks is None:
                 callbacks = [paddle.nn.clip.error_clip_callback]
             else:
                 assert isinstance(callbacks, list)
             program = loss.block.program
-            assert np.prod(loss.shape) == 1, (
+            assert all(s == 1 for s in loss.shape), (
                 f"The number of elements of loss should be 1, but the current loss.shape is {loss.shape}, whose number of elements is not 1. "
                 "Maybe that you should call paddle.mean to process the current loss."
             )
@@ -1497,13 +1574,14 @@ class Optimizer:
                             for param in program_all_params
                             if param.stop_gradient is False
                         ]
-                    params_grads = []
                     grads = paddle.autograd.ir_backward.grad(
                         loss, parameter_list, no_grad_vars=act_no_grad_set
                     )
-                    for index, grad in enumerate(grads):
-                        if grad is not None:
-                            params_grads.append((parameter_list[index], grad))
+                    params_grads = [
+                        (param, grad)
+                        for param, grad in zip(parameter_list, grads)
+                        if grad is not None
+                    ]
                 else:
                     from paddle.incubate.autograd.utils import prim_enabled
 
@@ -1548,7 +1626,11 @@ class Optimizer:
 
         # NOTE(zhaoyinglia): AutoParallel set '_sorted' attribute to skip the 'sorted' operator.
         if not hasattr(self, "_sorted"):
-            params_grads = sorted(params_grads, key=lambda x: x[0].name)
+            names = [pg[0].name for pg in params_grads]
+            # pairs are usually in name order already, only sort if not
+            if any(a > b for a, b in zip(names, names[1:])):
+                order = sorted(range(len(names)), key=names.__getitem__)
+                params_grads = [params_grads[i] for i in order]
 
         # 'optimizer(grad_clip)' or 'set_gradient_clip'
         if self._grad_clip is not None:
@@ -1627,13 +1709,10 @@ class Optimizer:
         Function helper of append_regularization_ops.
         """
         # If no gradient or no regularization is specified,  then we don't need to do anything
-        if grad is None or (
-            (
-                not hasattr(param, 'regularizer')
-                or (hasattr(param, 'regularizer') and param.regularizer is None)
-            )
-            and regularization is None
-        ):
+        if grad is None:
+            return grad
+        regularizer = getattr(param, 'regularizer', None)
+        if regularizer is None and regularization is None:
             return grad
         regularization_term = None
 
@@ -1652,10 +1731,13 @@ class Optimizer:
                     target_param = param.astype(grad.dtype)
             return target_param
 
-        param = get_target_param(param, grad)
-        if hasattr(param, 'regularizer') and param.regularizer is not None:
+        target_param = get_target_param(param, grad)
+        if target_param is not param:
+            regularizer = getattr(target_param, 'regularizer', None)
+            param = target_param
+        if regularizer is not None:
             # Add variable for regularization term in grad block
-            regularization_term = param.regularizer(param, grad, grad.block)
+            regularization_term = regularizer(param, grad, grad.block)
         elif regularization is not None:
             regularization_term = regularization(param, grad, grad.block)
 
@@ -1709,14 +1791,18 @@ class Optimizer:
         Raises:
             Exception: Unknown regularization type
         """
-        params_and_grads = []
         if framework.in_dygraph_mode() or in_pir_mode():
-            for param, grad in parameters_and_grads:
-                new_grad = self._create_regularization_of_grad(
-                    param, grad, regularization
+            params_and_grads = [
+                (
+                    param,
+                    self._create_regularization_of_grad(
+                        param, grad, regularization
+                    ),
                 )
-                params_and_grads.append((param, new_grad))
+                for param, grad in parameters_and_grads
+            ]
         else:
+            params_and_grads = []
             repeate_regularizer = False
             with framework.name_scope('regularization'):
                 for param, grad in parameters_and_grads:
@@ -1730,6 +1816,12 @@ class Optimizer:
                             "If regularizer of a Parameter has been set by 'base.ParamAttr' or 'base.WeightNormParamAttr' already. "
                             f"The Regularization[{regularization}] in Optimizer will not take effect, and it will only be applied to other Parameters!"
                         )
+                    # nothing is appended for this pair, skip the guard
+                    if grad is None or (
+                        param.regularizer is None and regularization is None
+                    ):
+                        params_and_grads.append((param, grad))
+                        continue
                     with param.block.program._optimized_guard([param, grad]):
                         new_grad = self._create_regularization_of_grad(
                             param, grad, regularization
@@ -1738,26 +1830,21 @@ class Optimizer:
         return params_and_grads
 
     def _get_no_grad_set(self, loss, no_grad_set=None):
+        parameters = loss.block.program.global_block().all_parameters()
+        # If the parameter is no trainable, it should not have a gradient.
         if in_pir_mode():
             no_grad_set = _get_no_grad_set_value(no_grad_set)
-            parameters = loss.block.program.global_block().all_parameters()
-            param_no_trainable = [
+            no_grad_set.update(
                 param for param in parameters if param.stop_gradient is True
-            ]
-            # If the parameter is no trainable, it should not have a gradient.
-            no_grad_set.update(param_no_trainable)
-            return no_grad_set
+            )
         else:
             no_grad_set = _get_no_grad_set_name(no_grad_set)
-            parameters = loss.block.program.global_block().all_parameters()
-            param_no_trainable = {
+            no_grad_set.update(
                 param.name
                 for param in parameters
                 if param.stop_gradient is True
-            }
-            # If the parameter is no trainable, it should not have a gradient.
-            no_grad_set.update(param_no_trainable)
-            return no_grad_set
+            )
+        return no_grad_set
 
     @framework.non_static_only
     def clear_grad(self, set_to_zero: bool = True) -> None:
@@ -1790,21 +1877,18 @@ class Optimizer:
                 >>> adam.clear_grad()
 
         """
-        param_list = []
         if self._parameter_list is None or not isinstance(
             self._parameter_list[0], dict
         ):
-            for p in self._parameter_list:
-                if not p.stop_gradient:
-                    param_list.append(p)
+            params = self._parameter_list
         else:
-            for param_group in self._param_groups:
-                for p in param_group['params']:
-                    if not p.stop_gradient:
-                        param_list.append(p)
+            params = itertools.chain.from_iterable(
+                param_group['params'] for param_group in self._param_groups
+            )
 
-        for p in param_list:
-            p.clear_gradient(set_to_zero)
+        for p in params:
+            if not p.stop_gradient:
+                p.clear_gradient(set_to_zero)
 
     @imperative_base.no_grad()
     def minimize(
@@ -1886,14 +1970,13 @@ class Optimizer:
             self._parameter_list[0], dict
         ), "Only list of parameters is supported while using optimizer in @paddle.jit.static."
         selected_params = {param.name for param in self._parameter_list}
-        parameters = [param for param in params if param.trainable]
-        parameters = list(
-            filter(
-                lambda x: x.name in selected_params and hasattr(x, "grad"),
-                parameters,
-            )
-        )
-        params_grads = [(param, param.grad) for param in parameters]
+        params_grads = [
+            (param, param.grad)
+            for param in params
+            if param.trainable
+            and param.name in selected_params
+            and hasattr(param, "grad")
+        ]
         optimize_ops = self.apply_gradients(params_grads)
 
     @imperative_base.no_grad()
@@ -1925,13 +2008,12 @@ class Optimizer:
             return
 
         if not isinstance(self._param_groups[0], dict):
-            params_grads = []
-            for param in self._param_groups:
-                if param.stop_gradient:
-                    continue
-                if param._grad_ivar() is not None:
-                    grad_var = param._grad_ivar()
-                    params_grads.append((param, grad_var))
+            params_grads = [
+                (param, grad_var)
+                for param in self._param_groups
+                if not param.stop_gradient
+                and (grad_var := param._grad_ivar()) is not None
+            ]
 
             self._apply_optimize(
                 loss=None,
@@ -1943,15 +2025,15 @@ class Optimizer:
         else:
             # optimize parameters in groups
             for idx, param_group in enumerate(self._param_groups):
-                params_grads = defaultdict(lambda: [])
-                for param in param_group['params']:
-                    if param.stop_gradient:
-                        continue
-                    if param._grad_ivar() is not None:
-                        grad_var = param._grad_ivar()
-                        params_grads['params'].append((param, grad_var))
+                params_grads = defaultdict(list)
+                params_grads['params'] = [
+                    (param, grad_var)
+                    for param in param_group['params']
+                    if not param.stop_gradient
+                    and (grad_var := param._grad_ivar()) is not None
+                ]
                 params_grads.update(
-                    {k: v for k, v in param_group.items() if k != 'params'}
+                    (k, v) for k, v in param_group.items() if k != 'params'
                 )
                 self._apply_optimize(
                     loss=None,
@@ -1983,11 +2065,13 @@ class Optimizer:
         for k, v in self._default_dict.items():
             param_group.setdefault(k, v)
 
+        # one set of the existing parameters per call, the new group is
+        # checked against it without being copied into a set as well
         param_set = set()
         for group in self._param_groups:
-            param_set.update(set(group['params']))
+            param_set.update(group['params'])
 
-        if not param_set.isdisjoint(set(param_group['params'])):
+        if not param_set.isdisjoint(param_group['params']):
             raise ValueError(
                 "some parameters appear in more than one parameter group"
             )
@@ -2044,13 +2128,4 @@ class Optimizer:
         assert isinstance(
             dtype, (core.VarDesc.VarType, core.DataType)
         ), "The dtype should be an instance of core.VarDesc.VarType or core.DataType."
-        if isinstance(dtype, core.VarDesc.VarType):
-            return (
-                dtype == core.VarDesc.VarType.FP16
-                or dtype == core.VarDesc.VarType.BF16
-            )
-        else:
-            return (
-                dtype == core.DataType.FLOAT16
-                or dtype == core.DataType.BFLOAT16
-            )
+        return dtype in _FP16_OR_BF16_DTYPES
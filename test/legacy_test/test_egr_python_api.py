@@ -25,29 +25,39 @@ from paddle.base.framework import (
     in_dygraph_mode,
 )
 
+FP32 = core.VarDesc.VarType.FP32
+DENSE_TENSOR = core.VarDesc.VarType.DENSE_TENSOR
+
 
 class EagerScaleTestCase(unittest.TestCase):
     def test_scale_base(self):
         paddle.set_device("cpu")
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
+        arr = np.ones([4, 16, 16, 32], dtype='float32')
         tensor = paddle.to_tensor(arr, 'float32', core.CPUPlace())
-        print(tensor)
-        tensor = core.eager.scale(tensor, 2.0, 0.9, True, False)
-        for i in range(0, 100):
+        num_calls = 10
+        for _ in range(num_calls):
             tensor = core.eager.scale(tensor, 2.0, 0.9, True, False)
-        print(tensor)
         self.assertEqual(tensor.shape, [4, 16, 16, 32])
         self.assertEqual(tensor.stop_gradient, True)
+        # n chained scale(x, 2.0, 0.9) calls equal x * 2**n + 0.9 * (2**n - 1)
+        scale = 2.0**num_calls
+        bias = 0.9 * (scale - 1.0)
+        np.testing.assert_allclose(
+            tensor.numpy(),
+            np.full(arr.shape, scale + bias, 'float32'),
+            rtol=1e-6,
+        )
 
     def test_retain_grad_and_run_backward(self):
         paddle.set_device("cpu")
 
-        input_data = np.ones([4, 16, 16, 32]).astype('float32')
+        input_data = np.ones([4, 16, 16, 32], dtype='float32')
         data_eager = paddle.to_tensor(
             input_data, 'float32', core.CPUPlace(), False
         )
 
-        grad_data = np.ones([4, 16, 16, 32]).astype('float32')
+        # the upstream grad is all ones as well, share the array
+        grad_data = input_data
         grad_eager = paddle.to_tensor(grad_data, 'float32', core.CPUPlace())
 
         data_eager.retain_grads()
@@ -61,13 +71,14 @@ class EagerScaleTestCase(unittest.TestCase):
     def test_retain_grad_and_run_backward_raises(self):
         paddle.set_device("cpu")
 
-        input_data = np.ones([4, 16, 16, 32]).astype('float32')
+        input_data = np.ones([4, 16, 16, 32], dtype='float32')
         data_eager = paddle.to_tensor(
             input_data, 'float32', core.CPUPlace(), False
         )
 
-        grad_data = np.ones([4, 16, 16, 32]).astype('float32')
-        grad_data2 = np.ones([4, 16]).astype('float32')
+        # the upstream grad is all ones as well, share the array
+        grad_data = input_data
+        grad_data2 = np.ones([4, 16], dtype='float32')
         grad_eager = paddle.to_tensor(grad_data, 'float32', core.CPUPlace())
         grad_eager2 = paddle.to_tensor(grad_data2, 'float32', core.CPUPlace())
 
@@ -88,29 +99,52 @@ class EagerScaleTestCase(unittest.TestCase):
 
 
 class EagerDtypeTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.base_arr = np.random.random([4, 16, 16, 32])
+
     def check_to_tensor_and_numpy(self, dtype, paddle_dtype):
-        arr = np.random.random([4, 16, 16, 32]).astype(dtype)
+        arr = self.base_arr.astype(dtype, copy=False)
         tensor = paddle.to_tensor(arr, dtype)
         self.assertEqual(tensor.dtype, paddle_dtype)
         np.testing.assert_array_equal(arr, tensor.numpy())
 
     def test_dtype_base(self):
-        print("Test_dtype")
-        self.check_to_tensor_and_numpy('bool', paddle.bool)
-        self.check_to_tensor_and_numpy('int8', paddle.int8)
-        self.check_to_tensor_and_numpy('uint8', paddle.uint8)
-        self.check_to_tensor_and_numpy('int16', paddle.int16)
-        self.check_to_tensor_and_numpy('int32', paddle.int32)
-        self.check_to_tensor_and_numpy('int64', paddle.int64)
-        self.check_to_tensor_and_numpy('float16', paddle.float16)
-        self.check_to_tensor_and_numpy('float32', paddle.float32)
-        self.check_to_tensor_and_numpy('float64', paddle.float64)
-        self.check_to_tensor_and_numpy('complex64', paddle.complex64)
-        self.check_to_tensor_and_numpy('complex128', paddle.complex128)
+        dtypes = [
+            ('bool', paddle.bool),
+            ('int8', paddle.int8),
+            ('uint8', paddle.uint8),
+            ('int16', paddle.int16),
+            ('int32', paddle.int32),
+            ('int64', paddle.int64),
+            ('float16', paddle.float16),
+            ('float32', paddle.float32),
+            ('float64', paddle.float64),
+            ('complex64', paddle.complex64),
+            ('complex128', paddle.complex128),
+        ]
+        for dtype, paddle_dtype in dtypes:
+            with self.subTest(dtype=dtype):
+                self.check_to_tensor_and_numpy(dtype, paddle_dtype)
 
 
 class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # input arrays shared by the tests below, none of them modify these
+        cls.arr0 = np.random.rand(4, 16, 16, 32).astype('float32')
+        cls.arr1 = np.random.randint(100, size=(4, 16, 16, 32), dtype=np.int64)
+        cls.arr2 = np.random.rand(4, 16, 16, 32, 64).astype('float32')
+        cls.arr4 = np.random.rand(4, 16, 16, 32).astype('float32')
+        cls.x = np.random.rand(3, 3).astype('float32')
+        cls.t = paddle.base.Tensor()
+        cls.t.set(cls.x, paddle.base.CPUPlace())
+        cls.ones = np.ones([4, 16, 16, 32], dtype='float32')
+        cls.twos = np.full([4, 16, 16, 32], 2.0, dtype='float32')
+
     def constructor(self, place):
+        expected_place = paddle.base.framework._current_expected_place()
+
         egr_tensor = core.eager.Tensor()
         self.assertEqual(egr_tensor.persistable, False)
         self.assertTrue("generated" in egr_tensor.name)
@@ -119,10 +153,10 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor.stop_gradient, True)
 
         egr_tensor0 = core.eager.Tensor(
-            core.VarDesc.VarType.FP32,
+            FP32,
             [4, 16, 16, 32],
             "test_eager_tensor",
-            core.VarDesc.VarType.DENSE_TENSOR,
+            DENSE_TENSOR,
             True,
         )
         self.assertEqual(egr_tensor0.persistable, True)
@@ -130,7 +164,7 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor0.shape, [4, 16, 16, 32])
         self.assertEqual(egr_tensor0.dtype, paddle.float32)
 
-        arr0 = np.random.rand(4, 16, 16, 32).astype('float32')
+        arr0 = self.arr0
         egr_tensor1 = core.eager.Tensor(
             arr0, place, True, False, "numpy_tensor1", False
         )
@@ -141,8 +175,11 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor1.stop_gradient, False)
         self.assertTrue(egr_tensor1.place._equals(place))
         np.testing.assert_array_equal(egr_tensor1.numpy(), arr0)
+        self.assertNotEqual(
+            egr_tensor1.data_ptr(), arr0.__array_interface__['data'][0]
+        )
 
-        arr1 = np.random.randint(100, size=(4, 16, 16, 32), dtype=np.int64)
+        arr1 = self.arr1
         egr_tensor2 = core.eager.Tensor(
             arr1, place, False, True, "numpy_tensor2", True
         )
@@ -153,20 +190,22 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor2.stop_gradient, True)
         self.assertTrue(egr_tensor2.place._equals(place))
         np.testing.assert_array_equal(egr_tensor2.numpy(), arr1)
+        # zero_copy on CPU shares the numpy buffer
+        if isinstance(place, core.CPUPlace):
+            self.assertEqual(
+                egr_tensor2.data_ptr(), arr1.__array_interface__['data'][0]
+            )
 
-        arr2 = np.random.rand(4, 16, 16, 32, 64).astype('float32')
+        arr2 = self.arr2
         egr_tensor3 = core.eager.Tensor(arr2)
         self.assertEqual(egr_tensor3.persistable, False)
         self.assertTrue("generated_tensor" in egr_tensor3.name)
         self.assertEqual(egr_tensor3.shape, [4, 16, 16, 32, 64])
         self.assertEqual(egr_tensor3.dtype, paddle.float32)
         self.assertEqual(egr_tensor3.stop_gradient, True)
-        self.assertTrue(
-            egr_tensor3.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        np.testing.assert_array_equal(egr_tensor3.numpy(), arr2)
+        self.assertTrue(egr_tensor3.place._equals(expected_place))
+        egr_tensor3_np = egr_tensor3.numpy()
+        np.testing.assert_array_equal(egr_tensor3_np, arr2)
 
         egr_tensor3.stop_gradient = False
         egr_tensor4 = core.eager.Tensor(egr_tensor3)
@@ -175,14 +214,10 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor4.shape, egr_tensor3.shape)
         self.assertEqual(egr_tensor4.dtype, egr_tensor3.dtype)
         self.assertEqual(egr_tensor4.stop_gradient, True)
-        self.assertTrue(
-            egr_tensor4.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        np.testing.assert_array_equal(egr_tensor4.numpy(), egr_tensor3.numpy())
+        self.assertTrue(egr_tensor4.place._equals(expected_place))
+        np.testing.assert_array_equal(egr_tensor4.numpy(), egr_tensor3_np)
 
-        arr4 = np.random.rand(4, 16, 16, 32).astype('float32')
+        arr4 = self.arr4
         egr_tensor5 = core.eager.Tensor(arr4, place)
         self.assertEqual(egr_tensor5.persistable, False)
         self.assertTrue("generated_tensor" in egr_tensor5.name)
@@ -190,7 +225,8 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor5.dtype, paddle.float32)
         self.assertEqual(egr_tensor5.stop_gradient, True)
         self.assertTrue(egr_tensor5.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor5.numpy(), arr4)
+        egr_tensor5_np = egr_tensor5.numpy()
+        np.testing.assert_array_equal(egr_tensor5_np, arr4)
 
         egr_tensor6 = core.eager.Tensor(egr_tensor5, core.CPUPlace())
         self.assertEqual(egr_tensor6.persistable, False)
@@ -199,7 +235,7 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor6.dtype, paddle.float32)
         self.assertEqual(egr_tensor6.stop_gradient, True)
         self.assertEqual(egr_tensor6.place.is_cpu_place(), True)
-        np.testing.assert_array_equal(egr_tensor6.numpy(), egr_tensor5.numpy())
+        np.testing.assert_array_equal(egr_tensor6.numpy(), egr_tensor5_np)
 
         egr_tensor7 = core.eager.Tensor(arr4, place, True)
         self.assertEqual(egr_tensor7.persistable, True)
@@ -217,7 +253,7 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor8.dtype, paddle.float32)
         self.assertEqual(egr_tensor8.stop_gradient, True)
         self.assertTrue(egr_tensor8.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor8.numpy(), egr_tensor5.numpy())
+        np.testing.assert_array_equal(egr_tensor8.numpy(), egr_tensor5_np)
 
         egr_tensor9 = core.eager.Tensor(arr4, place, True, True)
         self.assertEqual(egr_tensor9.persistable, True)
@@ -227,10 +263,13 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor9.stop_gradient, True)
         self.assertTrue(egr_tensor9.place._equals(place))
         np.testing.assert_array_equal(egr_tensor9.numpy(), arr4)
+        if isinstance(place, core.CPUPlace):
+            self.assertEqual(
+                egr_tensor9.data_ptr(), arr4.__array_interface__['data'][0]
+            )
 
-        x = np.random.rand(3, 3).astype('float32')
-        t = paddle.base.Tensor()
-        t.set(x, paddle.base.CPUPlace())
+        x = self.x
+        t = self.t
         egr_tensor10 = core.eager.Tensor(t, place)
         self.assertEqual(egr_tensor10.persistable, False)
         self.assertTrue("generated_tensor" in egr_tensor10.name)
@@ -261,21 +300,25 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         zero_dim_param = EagerParamBase(shape=[], dtype="float32")
         self.assertEqual(zero_dim_param.shape, [])
 
-        with self.assertRaisesRegex(
-            ValueError, "The shape of Parameter should not be None"
-        ):
-            eager_param = EagerParamBase(shape=None, dtype="float32")
-
-        with self.assertRaisesRegex(
-            ValueError, "The dtype of Parameter should not be None"
-        ):
-            eager_param = EagerParamBase(shape=[1, 1], dtype=None)
-
-        with self.assertRaisesRegex(
-            ValueError,
-            "Each dimension of shape for Parameter must be greater than 0, but received /*",
-        ):
-            eager_param = EagerParamBase(shape=[-1], dtype="float32")
+        invalid_cases = [
+            (
+                dict(shape=None, dtype="float32"),
+                "The shape of Parameter should not be None",
+            ),
+            (
+                dict(shape=[1, 1], dtype=None),
+                "The dtype of Parameter should not be None",
+            ),
+            (
+                dict(shape=[-1], dtype="float32"),
+                "Each dimension of shape for Parameter must be greater than 0, but received /*",
+            ),
+        ]
+        for kwargs, regex in invalid_cases:
+            with self.subTest(**kwargs), self.assertRaisesRegex(
+                ValueError, regex
+            ):
+                EagerParamBase(**kwargs)
 
         eager_param = EagerParamBase(shape=[1, 1], dtype="float32")
         self.assertTrue(eager_param.trainable)
@@ -286,207 +329,173 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         ):
             eager_param.trainable = "False"
 
-        eager_param_2 = EagerParamBase(
+    def test_param_base_with_tensor_shape(self):
+        eager_param = EagerParamBase(
             shape=paddle.shape(paddle.to_tensor([1, 2, 3, 4])), dtype="float32"
         )
-        self.assertTrue(eager_param_2.trainable)
-        eager_param_2.trainable = False
-        self.assertFalse(eager_param_2.trainable)
+        self.assertEqual(eager_param.shape, [4])
+        self.assertTrue(eager_param.trainable)
+        eager_param.trainable = False
+        self.assertFalse(eager_param.trainable)
         with self.assertRaisesRegex(
             ValueError, "The type of trainable MUST be bool, but the type is /*"
         ):
-            eager_param_2.trainable = "False"
+            eager_param.trainable = "False"
 
-    def test_constructor(self):
-        print("Test_constructor")
+    def test_constructor_cpu(self):
         paddle.set_device("cpu")
-        place_list = [core.CPUPlace()]
-        if core.is_compiled_with_cuda():
-            place_list.append(core.CUDAPlace(0))
+        self.constructor(core.CPUPlace())
 
-        for p in place_list:
-            self.constructor(p)
+    @unittest.skipIf(
+        not core.is_compiled_with_cuda(), "core is not compiled with CUDA"
+    )
+    def test_constructor_gpu(self):
+        paddle.set_device("cpu")
+        self.constructor(core.CUDAPlace(0))
+
+    def check_tensor(
+        self,
+        tensor,
+        persistable,
+        name,
+        place,
+        stop_gradient,
+        shape=None,
+        dtype=paddle.float32,
+    ):
+        self.assertEqual(tensor.persistable, persistable)
+        self.assertTrue(name in tensor.name)
+        self.assertEqual(tensor.shape, shape or [4, 16, 16, 32])
+        self.assertTrue(tensor.place._equals(place))
+        self.assertEqual(tensor.dtype, dtype)
+        self.assertEqual(tensor.stop_gradient, stop_gradient)
 
     def constructor_with_kwargs(self, place):
-        # init Tensor by Python array
-        arr = np.random.rand(4, 16, 16, 32).astype('float32')
-
-        egr_tensor0 = core.eager.Tensor(value=arr)
-        self.assertEqual(egr_tensor0.persistable, False)
-        self.assertTrue("generated" in egr_tensor0.name)
-        self.assertEqual(egr_tensor0.shape, [4, 16, 16, 32])
-        self.assertTrue(
-            egr_tensor0.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        self.assertEqual(egr_tensor0.dtype, paddle.float32)
-        self.assertEqual(egr_tensor0.stop_gradient, True)
-
-        egr_tensor1 = core.eager.Tensor(value=arr, place=place)
-        self.assertEqual(egr_tensor1.persistable, False)
-        self.assertTrue("generated" in egr_tensor1.name)
-        self.assertEqual(egr_tensor1.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor1.place._equals(place))
-        self.assertEqual(egr_tensor1.dtype, paddle.float32)
-        self.assertEqual(egr_tensor1.stop_gradient, True)
-
-        egr_tensor2 = core.eager.Tensor(arr, place=place)
-        self.assertEqual(egr_tensor2.persistable, False)
-        self.assertTrue("generated" in egr_tensor2.name)
-        self.assertEqual(egr_tensor2.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor2.place._equals(place))
-        self.assertEqual(egr_tensor2.dtype, paddle.float32)
-        self.assertEqual(egr_tensor2.stop_gradient, True)
-
-        egr_tensor3 = core.eager.Tensor(
-            arr, place=place, name="new_eager_tensor"
-        )
-        self.assertEqual(egr_tensor3.persistable, False)
-        self.assertTrue("new_eager_tensor" in egr_tensor3.name)
-        self.assertEqual(egr_tensor3.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor3.place._equals(place))
-        self.assertEqual(egr_tensor3.dtype, paddle.float32)
-        self.assertEqual(egr_tensor3.stop_gradient, True)
-
-        egr_tensor4 = core.eager.Tensor(
-            arr, place=place, persistable=True, name="new_eager_tensor"
-        )
-        self.assertEqual(egr_tensor4.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor4.name)
-        self.assertEqual(egr_tensor4.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor4.place._equals(place))
-        self.assertEqual(egr_tensor4.dtype, paddle.float32)
-        self.assertEqual(egr_tensor4.stop_gradient, True)
-
-        egr_tensor5 = core.eager.Tensor(
-            arr,
-            core.CPUPlace(),
-            persistable=True,
-            name="new_eager_tensor",
-            zero_copy=True,
-        )
-        self.assertEqual(egr_tensor5.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor5.name)
-        self.assertEqual(egr_tensor5.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor5.place.is_cpu_place())
-        self.assertEqual(egr_tensor5.dtype, paddle.float32)
-        self.assertEqual(egr_tensor5.stop_gradient, True)
-
-        egr_tensor6 = core.eager.Tensor(
-            arr,
-            place=core.CPUPlace(),
-            persistable=True,
-            name="new_eager_tensor",
-            zero_copy=True,
-        )
-        self.assertEqual(egr_tensor6.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor6.name)
-        self.assertEqual(egr_tensor6.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor6.place.is_cpu_place())
-        self.assertEqual(egr_tensor6.dtype, paddle.float32)
-        self.assertEqual(egr_tensor6.stop_gradient, True)
+        expected_place = paddle.base.framework._current_expected_place()
 
-        egr_tensor7 = core.eager.Tensor(
-            arr,
-            place=place,
-            persistable=True,
-            name="new_eager_tensor",
-            zero_copy=True,
-        )
-        self.assertEqual(egr_tensor7.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor7.name)
-        self.assertEqual(egr_tensor7.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor7.place._equals(place))
-        self.assertEqual(egr_tensor7.dtype, paddle.float32)
-        self.assertEqual(egr_tensor7.stop_gradient, True)
-
-        egr_tensor8 = core.eager.Tensor(
-            arr,
-            place=place,
-            persistable=True,
-            name="new_eager_tensor",
-            zero_copy=True,
-            stop_gradient=False,
-        )
-        self.assertEqual(egr_tensor8.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor8.name)
-        self.assertEqual(egr_tensor8.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor8.place._equals(place))
-        self.assertEqual(egr_tensor8.dtype, paddle.float32)
-        self.assertEqual(egr_tensor8.stop_gradient, False)
-
-        egr_tensor9 = core.eager.Tensor(
-            arr, place, True, True, "new_eager_tensor", stop_gradient=False
-        )
-        self.assertEqual(egr_tensor9.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor9.name)
-        self.assertEqual(egr_tensor9.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor9.place._equals(place))
-        self.assertEqual(egr_tensor9.dtype, paddle.float32)
-        self.assertEqual(egr_tensor9.stop_gradient, False)
-
-        egr_tensor10 = core.eager.Tensor(
-            arr, place, True, True, name="new_eager_tensor", stop_gradient=False
-        )
-        self.assertEqual(egr_tensor10.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor10.name)
-        self.assertEqual(egr_tensor10.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor10.place._equals(place))
-        self.assertEqual(egr_tensor10.dtype, paddle.float32)
-        self.assertEqual(egr_tensor10.stop_gradient, False)
-
-        egr_tensor11 = core.eager.Tensor(
-            arr,
-            place,
-            True,
-            zero_copy=True,
-            name="new_eager_tensor",
-            stop_gradient=False,
-        )
-        self.assertEqual(egr_tensor11.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor11.name)
-        self.assertEqual(egr_tensor11.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor11.place._equals(place))
-        self.assertEqual(egr_tensor11.dtype, paddle.float32)
-        self.assertEqual(egr_tensor11.stop_gradient, False)
-
-        egr_tensor12 = core.eager.Tensor(
-            arr,
-            place,
-            persistable=True,
-            zero_copy=True,
-            name="new_eager_tensor",
-            stop_gradient=False,
-        )
-        self.assertEqual(egr_tensor12.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor12.name)
-        self.assertEqual(egr_tensor12.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor12.place._equals(place))
-        self.assertEqual(egr_tensor12.dtype, paddle.float32)
-        self.assertEqual(egr_tensor12.stop_gradient, False)
-
-        egr_tensor13 = core.eager.Tensor(
-            value=arr,
-            place=place,
-            persistable=True,
-            zero_copy=True,
-            name="new_eager_tensor",
-            stop_gradient=False,
-        )
-        self.assertEqual(egr_tensor13.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor13.name)
-        self.assertEqual(egr_tensor13.shape, [4, 16, 16, 32])
-        self.assertTrue(egr_tensor13.place._equals(place))
-        self.assertEqual(egr_tensor13.dtype, paddle.float32)
-        self.assertEqual(egr_tensor13.stop_gradient, False)
+        # init Tensor by Python array
+        arr = self.arr4
+        name = "new_eager_tensor"
+        # (args, kwargs, persistable, name, place, stop_gradient)
+        cases = [
+            ((), dict(value=arr), False, "generated", expected_place, True),
+            ((), dict(value=arr, place=place), False, "generated", place, True),
+            ((arr,), dict(place=place), False, "generated", place, True),
+            ((arr,), dict(place=place, name=name), False, name, place, True),
+            (
+                (arr,),
+                dict(place=place, persistable=True, name=name),
+                True,
+                name,
+                place,
+                True,
+            ),
+            (
+                (arr, core.CPUPlace()),
+                dict(persistable=True, name=name, zero_copy=True),
+                True,
+                name,
+                core.CPUPlace(),
+                True,
+            ),
+            (
+                (arr,),
+                dict(
+                    place=core.CPUPlace(),
+                    persistable=True,
+                    name=name,
+                    zero_copy=True,
+                ),
+                True,
+                name,
+                core.CPUPlace(),
+                True,
+            ),
+            (
+                (arr,),
+                dict(place=place, persistable=True, name=name, zero_copy=True),
+                True,
+                name,
+                place,
+                True,
+            ),
+            (
+                (arr,),
+                dict(
+                    place=place,
+                    persistable=True,
+                    name=name,
+                    zero_copy=True,
+                    stop_gradient=False,
+                ),
+                True,
+                name,
+                place,
+                False,
+            ),
+            (
+                (arr, place, True, True, name),
+                dict(stop_gradient=False),
+                True,
+                name,
+                place,
+                False,
+            ),
+            (
+                (arr, place, True, True),
+                dict(name=name, stop_gradient=False),
+                True,
+                name,
+                place,
+                False,
+            ),
+            (
+                (arr, place, True),
+                dict(zero_copy=True, name=name, stop_gradient=False),
+                True,
+                name,
+                place,
+                False,
+            ),
+            (
+                (arr, place),
+                dict(
+                    persistable=True,
+                    zero_copy=True,
+                    name=name,
+                    stop_gradient=False,
+                ),
+                True,
+                name,
+                place,
+                False,
+            ),
+            (
+                (),
+                dict(
+                    value=arr,
+                    place=place,
+                    persistable=True,
+                    zero_copy=True,
+                    name=name,
+                    stop_gradient=False,
+                ),
+                True,
+                name,
+                place,
+                False,
+            ),
+        ]
+        for i, (args, kwargs, *expected) in enumerate(cases):
+            with self.subTest(case=i):
+                self.check_tensor(core.eager.Tensor(*args, **kwargs), *expected)
 
         # special case
         egr_tensor14 = core.eager.Tensor(
-            dtype=core.VarDesc.VarType.FP32,
+            dtype=FP32,
             dims=[4, 16, 16, 32],
             name="special_eager_tensor",
-            type=core.VarDesc.VarType.DENSE_TENSOR,
+            type=DENSE_TENSOR,
             persistable=True,
         )
         self.assertEqual(egr_tensor14.persistable, True)
@@ -495,169 +504,85 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(egr_tensor14.dtype, paddle.float32)
 
         # init Tensor by Tensor
-        egr_tensor15 = core.eager.Tensor(value=egr_tensor4)
-        self.assertEqual(egr_tensor15.persistable, True)
-        self.assertTrue("generated" in egr_tensor15.name)
-        self.assertEqual(egr_tensor15.shape, egr_tensor4.shape)
-        self.assertEqual(egr_tensor15.dtype, egr_tensor4.dtype)
-        self.assertEqual(egr_tensor15.stop_gradient, True)
-        self.assertTrue(
-            egr_tensor15.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        np.testing.assert_array_equal(egr_tensor15.numpy(), egr_tensor4.numpy())
-
-        egr_tensor16 = core.eager.Tensor(
-            value=egr_tensor4, name="new_eager_tensor"
-        )
-        self.assertEqual(egr_tensor16.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor16.name)
-        self.assertEqual(egr_tensor16.shape, egr_tensor4.shape)
-        self.assertEqual(egr_tensor16.dtype, egr_tensor4.dtype)
-        self.assertEqual(egr_tensor16.stop_gradient, True)
-        self.assertTrue(
-            egr_tensor16.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        np.testing.assert_array_equal(egr_tensor16.numpy(), egr_tensor4.numpy())
-
-        egr_tensor17 = core.eager.Tensor(
-            value=egr_tensor4,
-            place=place,
-            name="new_eager_tensor",
-        )
-        self.assertEqual(egr_tensor17.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor17.name)
-        self.assertEqual(egr_tensor17.shape, egr_tensor4.shape)
-        self.assertEqual(egr_tensor17.dtype, egr_tensor4.dtype)
-        self.assertEqual(egr_tensor17.stop_gradient, True)
-        self.assertTrue(egr_tensor17.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor17.numpy(), egr_tensor4.numpy())
-
-        egr_tensor18 = core.eager.Tensor(
-            egr_tensor4,
-            place=place,
-            name="new_eager_tensor",
-        )
-        self.assertEqual(egr_tensor18.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor18.name)
-        self.assertEqual(egr_tensor18.shape, egr_tensor4.shape)
-        self.assertEqual(egr_tensor18.dtype, egr_tensor4.dtype)
-        self.assertEqual(egr_tensor18.stop_gradient, True)
-        self.assertTrue(egr_tensor18.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor18.numpy(), egr_tensor4.numpy())
-
-        egr_tensor19 = core.eager.Tensor(
-            egr_tensor4,
-            place,
-            name="new_eager_tensor",
-        )
-        self.assertEqual(egr_tensor19.persistable, True)
-        self.assertTrue("new_eager_tensor" in egr_tensor19.name)
-        self.assertEqual(egr_tensor19.shape, egr_tensor4.shape)
-        self.assertEqual(egr_tensor19.dtype, egr_tensor4.dtype)
-        self.assertEqual(egr_tensor19.stop_gradient, True)
-        self.assertTrue(egr_tensor19.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor19.numpy(), egr_tensor4.numpy())
+        egr_tensor4 = core.eager.Tensor(
+            arr, place=place, persistable=True, name=name
+        )
+        egr_tensor4_np = egr_tensor4.numpy()
+        cases = [
+            ((), dict(value=egr_tensor4), "generated", expected_place),
+            ((), dict(value=egr_tensor4, name=name), name, expected_place),
+            ((), dict(value=egr_tensor4, place=place, name=name), name, place),
+            ((egr_tensor4,), dict(place=place, name=name), name, place),
+            ((egr_tensor4, place), dict(name=name), name, place),
+        ]
+        for i, (args, kwargs, tensor_name, tensor_place) in enumerate(cases):
+            with self.subTest(case=i):
+                tensor = core.eager.Tensor(*args, **kwargs)
+                self.check_tensor(
+                    tensor,
+                    True,
+                    tensor_name,
+                    tensor_place,
+                    True,
+                    shape=egr_tensor4.shape,
+                    dtype=egr_tensor4.dtype,
+                )
+                np.testing.assert_array_equal(tensor.numpy(), egr_tensor4_np)
 
         # init eager tensor by framework tensor
-        x = np.random.rand(3, 3).astype('float32')
-        t = paddle.base.Tensor()
-        t.set(x, paddle.base.CPUPlace())
-        egr_tensor20 = core.eager.Tensor(value=t)
-        self.assertEqual(egr_tensor20.persistable, False)
-        self.assertTrue("generated_tensor" in egr_tensor20.name)
-        self.assertEqual(egr_tensor20.shape, [3, 3])
-        self.assertEqual(egr_tensor20.dtype, paddle.float32)
-        self.assertEqual(egr_tensor20.stop_gradient, True)
-        self.assertTrue(
-            egr_tensor20.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
-        np.testing.assert_array_equal(egr_tensor20.numpy(), x)
-
-        egr_tensor21 = core.eager.Tensor(value=t, place=place)
-        self.assertEqual(egr_tensor21.persistable, False)
-        self.assertTrue("generated_tensor" in egr_tensor21.name)
-        self.assertEqual(egr_tensor21.shape, [3, 3])
-        self.assertEqual(egr_tensor21.dtype, paddle.float32)
-        self.assertEqual(egr_tensor21.stop_gradient, True)
-        self.assertTrue(egr_tensor21.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor21.numpy(), x)
-
-        egr_tensor22 = core.eager.Tensor(t, place=place)
-        self.assertEqual(egr_tensor22.persistable, False)
-        self.assertTrue("generated_tensor" in egr_tensor22.name)
-        self.assertEqual(egr_tensor22.shape, [3, 3])
-        self.assertEqual(egr_tensor22.dtype, paddle.float32)
-        self.assertEqual(egr_tensor22.stop_gradient, True)
-        self.assertTrue(egr_tensor22.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor22.numpy(), x)
-
-        egr_tensor23 = core.eager.Tensor(t, place, name="from_framework_tensor")
-        self.assertEqual(egr_tensor23.persistable, False)
-        self.assertTrue("from_framework_tensor" in egr_tensor23.name)
-        self.assertEqual(egr_tensor23.shape, [3, 3])
-        self.assertEqual(egr_tensor23.dtype, paddle.float32)
-        self.assertEqual(egr_tensor23.stop_gradient, True)
-        self.assertTrue(egr_tensor23.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor23.numpy(), x)
-
-        egr_tensor24 = core.eager.Tensor(
-            value=t, place=place, name="from_framework_tensor"
-        )
-        self.assertEqual(egr_tensor24.persistable, False)
-        self.assertTrue("from_framework_tensor" in egr_tensor24.name)
-        self.assertEqual(egr_tensor24.shape, [3, 3])
-        self.assertEqual(egr_tensor24.dtype, paddle.float32)
-        self.assertEqual(egr_tensor24.stop_gradient, True)
-        self.assertTrue(egr_tensor24.place._equals(place))
-        np.testing.assert_array_equal(egr_tensor24.numpy(), x)
+        x = self.x
+        t = self.t
+        name = "from_framework_tensor"
+        cases = [
+            ((), dict(value=t), "generated_tensor", expected_place),
+            ((), dict(value=t, place=place), "generated_tensor", place),
+            ((t,), dict(place=place), "generated_tensor", place),
+            ((t, place), dict(name=name), name, place),
+            ((), dict(value=t, place=place, name=name), name, place),
+        ]
+        for i, (args, kwargs, tensor_name, tensor_place) in enumerate(cases):
+            with self.subTest(case=i):
+                tensor = core.eager.Tensor(*args, **kwargs)
+                self.check_tensor(
+                    tensor, False, tensor_name, tensor_place, True, shape=[3, 3]
+                )
+                np.testing.assert_array_equal(tensor.numpy(), x)
 
         # Bad usage
         # SyntaxError: positional argument follows keyword argument
         # egr_tensor25 = core.eager.Tensor(value=t, place)
 
-    def test_constructor_with_kwargs(self):
-        print("Test_constructor_with_kwargs")
+    def test_constructor_with_kwargs_cpu(self):
         paddle.set_device("cpu")
-        place_list = [core.CPUPlace()]
-        if core.is_compiled_with_cuda():
-            place_list.append(core.CUDAPlace(0))
+        self.constructor_with_kwargs(core.CPUPlace())
 
-        for p in place_list:
-            self.constructor_with_kwargs(p)
+    @unittest.skipIf(
+        not core.is_compiled_with_cuda(), "core is not compiled with CUDA"
+    )
+    def test_constructor_with_kwargs_gpu(self):
+        paddle.set_device("cpu")
+        self.constructor_with_kwargs(core.CUDAPlace(0))
 
     def test_copy_and_copy_to(self):
-        print("Test_copy_and_copy_to")
-
         paddle.set_device("cpu")
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
-        arr1 = np.zeros([4, 16]).astype('float32')
-        arr2 = np.ones([4, 16, 16, 32]).astype('float32') + np.ones(
-            [4, 16, 16, 32]
-        ).astype('float32')
-        tensor = paddle.to_tensor(arr, paddle.float32, core.CPUPlace())
+        arr = np.ones([4, 16, 16, 32], dtype='float32')
+        arr1 = np.zeros([4, 16], dtype='float32')
+        arr2 = np.full([4, 16, 16, 32], 2.0, dtype='float32')
+        tensor = core.eager.Tensor(arr, core.CPUPlace())
         self.assertEqual(tensor.stop_gradient, True)
         tensor.stop_gradient = False
-        print("Set persistable")
         tensor.persistable = False
-        tensor1 = paddle.to_tensor(arr1, paddle.float32, core.CPUPlace())
+        tensor1 = core.eager.Tensor(arr1, core.CPUPlace())
         tensor1.persistable = True
         self.assertEqual(tensor1.stop_gradient, True)
         np.testing.assert_array_equal(tensor.numpy(), arr)
-        print("Test copy_")
         tensor.copy_(tensor1, True)
         self.assertEqual(tensor.persistable, False)
         self.assertEqual(tensor.shape, [4, 16])
         self.assertEqual(tensor.dtype, paddle.float32)
         np.testing.assert_array_equal(tensor.numpy(), arr1)
 
-        print("Test _copy_to")
-        tensor2 = paddle.to_tensor(arr2, paddle.float32, core.CPUPlace())
+        tensor2 = core.eager.Tensor(arr2, core.CPUPlace())
         np.testing.assert_array_equal(tensor2.numpy(), arr2)
         self.assertTrue(tensor2.place.is_cpu_place())
         tensor2.persistable = True
@@ -698,11 +623,8 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
             self.assertTrue(tensor4.place.is_cpu_place())
 
     def test_share_buffer_to(self):
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
-        arr1 = np.zeros([4, 16]).astype('float32')
-        arr2 = np.ones([4, 16, 16, 32]).astype('float32') + np.ones(
-            [4, 16, 16, 32]
-        ).astype('float32')
+        arr = self.ones
+        arr2 = self.twos
         tensor = None
         tensor2 = None
         tensor = paddle.to_tensor(arr, paddle.float32, core.CPUPlace())
@@ -723,16 +645,13 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertTrue(tensor3._is_shared_buffer_with(tensor))
 
     def test_0_size_tensor_share_buffer_to(self):
-        x = paddle.rand([0, 4])
-        y = paddle.rand([0, 4])
+        x = paddle.empty([0, 4], dtype='float32')
+        y = paddle.empty([0, 4], dtype='float32')
         x._share_buffer_to(y)
 
     def test_share_underline_tensor_to(self):
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
-        arr1 = np.zeros([4, 16]).astype('float32')
-        arr2 = np.ones([4, 16, 16, 32]).astype('float32') + np.ones(
-            [4, 16, 16, 32]
-        ).astype('float32')
+        arr = self.ones
+        arr2 = self.twos
         tensor = None
         tensor2 = None
         tensor = paddle.to_tensor(arr, paddle.float32, core.CPUPlace())
@@ -753,10 +672,9 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertTrue(tensor3._is_shared_underline_tensor_with(tensor))
 
     def test_properties(self):
-        print("Test_properties")
         paddle.set_device("cpu")
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
-        tensor = paddle.to_tensor(arr, paddle.float32, core.CPUPlace())
+        # only metadata is checked, so skip filling the tensor
+        tensor = paddle.empty([4, 16, 16, 32], dtype='float32')
         self.assertEqual(tensor.shape, [4, 16, 16, 32])
         tensor.name = 'tensor_name_test'
         self.assertEqual(tensor.name, 'tensor_name_test')
@@ -772,38 +690,27 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         self.assertEqual(tensor.stop_gradient, False)
         tensor.stop_gradient = True
         self.assertEqual(tensor.stop_gradient, True)
-        self.assertEqual(tensor.type, core.VarDesc.VarType.DENSE_TENSOR)
+        self.assertEqual(tensor.type, DENSE_TENSOR)
 
     def test_global_properties(self):
-        print("Test_global_properties")
         self.assertTrue(in_dygraph_mode())
 
     def test_place_guard(self):
-        if core.is_compiled_with_cuda():
-            paddle.set_device("gpu:0")
-            with paddle.base.framework._dygraph_place_guard(core.CPUPlace()):
-                self.assertTrue(
-                    isinstance(_current_expected_place(), type(core.CPUPlace()))
-                )
-        else:
-            paddle.set_device("cpu")
-            with paddle.base.framework._dygraph_place_guard(core.CPUPlace()):
-                self.assertTrue(
-                    isinstance(_current_expected_place(), type(core.CPUPlace()))
-                )
+        paddle.set_device("gpu:0" if core.is_compiled_with_cuda() else "cpu")
+        with paddle.base.framework._dygraph_place_guard(core.CPUPlace()):
+            self.assertTrue(
+                isinstance(_current_expected_place(), type(core.CPUPlace()))
+            )
 
     def test_value(self):
-        arr = np.random.rand(4, 16, 16, 32).astype('float64')
+        arr = self.arr0.astype('float64')
+        expected_place = paddle.base.framework._current_expected_place()
 
         egr_tensor0 = core.eager.Tensor(value=arr)
         self.assertEqual(egr_tensor0.persistable, False)
         self.assertTrue("generated" in egr_tensor0.name)
         self.assertEqual(egr_tensor0.shape, [4, 16, 16, 32])
-        self.assertTrue(
-            egr_tensor0.place._equals(
-                paddle.base.framework._current_expected_place()
-            )
-        )
+        self.assertTrue(egr_tensor0.place._equals(expected_place))
         self.assertEqual(egr_tensor0.dtype, paddle.float64)
         self.assertEqual(egr_tensor0.stop_gradient, True)
         self.assertTrue(
@@ -812,19 +719,19 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         )
         self.assertTrue(
             egr_tensor0.value().get_tensor()._place(),
-            paddle.base.framework._current_expected_place(),
+            expected_place,
         )
         self.assertTrue(egr_tensor0.value().get_tensor()._is_initialized())
 
     def test_set_value(self):
-        ori_arr = np.random.rand(4, 16, 16, 32).astype('float32')
+        ori_arr = self.arr0
         egr_tensor = core.eager.Tensor(value=ori_arr)
         self.assertEqual(egr_tensor.stop_gradient, True)
         self.assertEqual(egr_tensor.shape, [4, 16, 16, 32])
         np.testing.assert_array_equal(egr_tensor.numpy(), ori_arr)
         ori_place = egr_tensor.place
 
-        new_arr = np.random.rand(4, 16, 16, 32).astype('float32')
+        new_arr = self.arr4
 
         self.assertFalse(np.array_equal(egr_tensor.numpy(), new_arr))
 
@@ -875,7 +782,7 @@ class EagerVariablePropertiesAndMethodsTestCase(unittest.TestCase):
         y = paddle.to_tensor(np_x, dtype="float64")
         self.assertEqual(x._md5sum(), y._md5sum())
         x = paddle.to_tensor(np_x, dtype="bfloat16")
-        y = paddle.to_tensor(np_x, dtype="bfloat16")
+        y = x.clone()
         self.assertEqual(x._md5sum(), y._md5sum())
 
 
@@ -938,7 +845,7 @@ class EagerParamBaseUsageTestCase(unittest.TestCase):
         arr4 = np.random.rand(4, 16, 16, 32).astype('float32')
         egr_tensor12 = core.eager.Tensor(arr4, core.CPUPlace())
         egr_tensor12.retain_grads()
-        arr = np.ones([4, 16, 16, 32]).astype('float32')
+        arr = np.ones([4, 16, 16, 32], dtype='float32')
         self.assertEqual(egr_tensor12.persistable, False)
         self.assertTrue("generated_tensor" in egr_tensor12.name)
         self.assertEqual(egr_tensor12.shape, [4, 16, 16, 32])
@@ -18,6 +18,7 @@ import unittest
 
 import numpy
 import numpy as np
+from utils import static_guard
 
 import paddle
 from paddle import base
@@ -164,6 +165,104 @@ class TestMasterWeightSaveForFP16(unittest.TestCase):
             np.testing.assert_array_equal(out_use_state_dict, out_no_state_dict)
 
 
+class FailOnceSGD(paddle.optimizer.SGD):
+    def __init__(self, *args, fail=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail = fail
+        self.param_lrs = {}
+
+    def _append_optimize_op(self, block, param_and_grad):
+        self.param_lrs[param_and_grad[0].name] = self._create_param_lr(
+            param_and_grad
+        )
+        if self.fail:
+            self.fail = False
+            raise RuntimeError("optimization pass failed")
+        return super()._append_optimize_op(block, param_and_grad)
+
+
+class TestOptimizationPassLrCache(unittest.TestCase):
+    def build_program(self, weight_lr=1.0, bias_lr=1.0):
+        main_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program, startup_program):
+            x = paddle.static.data(name='x', shape=[4, 2], dtype='float32')
+            linear = paddle.nn.Linear(
+                2,
+                1,
+                weight_attr=paddle.ParamAttr(learning_rate=weight_lr),
+                bias_attr=paddle.ParamAttr(learning_rate=bias_lr),
+            )
+            loss = paddle.mean(linear(x))
+        return main_program, startup_program, loss
+
+    def test_retry_after_failed_pass(self):
+        with static_guard():
+            opt = FailOnceSGD(learning_rate=0.1)
+            main_program, startup_program, loss = self.build_program()
+            with paddle.static.program_guard(main_program, startup_program):
+                with self.assertRaises(RuntimeError):
+                    opt.minimize(loss)
+            self.assertIsNone(opt._cached_global_lr)
+
+            main_program, startup_program, loss = self.build_program()
+            with paddle.static.program_guard(main_program, startup_program):
+                # the lr of the failed program must not leak into this one
+                self.assertIsNone(opt._get_pass_global_learning_rate())
+                opt.param_lrs.clear()
+                opt.minimize(loss)
+                global_lr = opt._global_learning_rate()
+            self.assertIsNotNone(global_lr)
+            for param_lr in opt.param_lrs.values():
+                self.assertIs(param_lr, global_lr)
+
+    def test_scaled_lr_cache_after_failed_pass(self):
+        with static_guard():
+            opt = FailOnceSGD(learning_rate=0.1)
+            main_program, startup_program, loss = self.build_program(
+                weight_lr=2.0, bias_lr=0.5
+            )
+            with paddle.static.program_guard(main_program, startup_program):
+                with self.assertRaises(RuntimeError):
+                    opt.minimize(loss)
+            self.assertEqual(opt._scaled_lr_cache, {})
+
+            main_program, startup_program, loss = self.build_program(
+                weight_lr=2.0, bias_lr=0.5
+            )
+            with paddle.static.program_guard(main_program, startup_program):
+                opt.param_lrs.clear()
+                opt.minimize(loss)
+            self.assertEqual(opt._scaled_lr_cache, {})
+            # parameters with different lr scales get their own scaled lr
+            self.assertEqual(len(opt.param_lrs), 2)
+            self.assertEqual(len({id(lr) for lr in opt.param_lrs.values()}), 2)
+
+    def count_scale_ops(self, program):
+        if paddle.framework.in_pir_mode():
+            return sum(
+                op.name() == 'pd_op.scale' for op in program.global_block().ops
+            )
+        return sum(op.type == 'scale' for op in program.global_block().ops)
+
+    def test_same_lr_scale_shares_scaled_lr(self):
+        with static_guard():
+            opt = FailOnceSGD(learning_rate=0.1, fail=False)
+            main_program, startup_program, loss = self.build_program(
+                weight_lr=2.0, bias_lr=2.0
+            )
+            with paddle.static.program_guard(main_program, startup_program):
+                num_scale_ops = self.count_scale_ops(main_program)
+                opt.minimize(loss)
+            self.assertEqual(len(opt.param_lrs), 2)
+            weight_lr, bias_lr = opt.param_lrs.values()
+            self.assertIs(weight_lr, bias_lr)
+            # the scaled lr is computed by a single scale op for both
+            self.assertEqual(
+                self.count_scale_ops(main_program) - num_scale_ops, 1
+            )
+
+
 if __name__ == '__main__':
     paddle.enable_static()
     unittest.main()